@@ -57,9 +57,11 @@ async function main(): Promise<void> {
     console.log("\n=== Range Queries ===");
 
     // Set multiple records with ordered keys
-    await client.set("users:001", "Alice");
-    await client.set("users:002", "Bob");
-    await client.set("users:003", "Charlie");
+    await client.multiSet({
+      "users:001": "Alice",
+      "users:002": "Bob",
+      "users:003": "Charlie",
+    });
 
     // Query records in a range
     const rangeResult = await client.range("users:001", "users:003", 10);
@@ -69,9 +71,11 @@ async function main(): Promise<void> {
     console.log("\n=== Nexus Search ===");
 
     // Set some documents for search
-    await client.set("doc:1", "The quick brown fox jumps over the lazy dog");
-    await client.set("doc:2", "A quick brown dog runs in the park");
-    await client.set("doc:3", "The lazy fox sleeps under the tree");
+    await client.multiSet({
+      "doc:1": "The quick brown fox jumps over the lazy dog",
+      "doc:2": "A quick brown dog runs in the park",
+      "doc:3": "The lazy fox sleeps under the tree",
+    });
 
     // wait for 30 seconds to ensure the documents are indexed
     await new Promise((resolve) => setTimeout(resolve, 30000));
@@ -1,13 +1,61 @@
 import {
   ApiError,
+  ClientOptions,
   RecordResponse,
+  RangeRecord,
   RangeResponse,
   QueryOptions,
   QueryResponse,
-  RequestOptions,
   SearchOptions,
   SearchResponse,
 } from "./types";
+import { HPKVError } from "./errors";
+import { HPKVPipeline } from "./pipeline";
+import { mapConcurrent, sleep } from "./utils";
+
+// Characters encodeURIComponent leaves untouched
+const URI_SAFE_KEY = /^[A-Za-z0-9_.!~*'()-]*$/;
+
+// Server errors that are retried for idempotent methods
+const RETRYABLE_STATUSES = new Set([500, 502, 503, 504]);
+const IDEMPOTENT_METHODS = new Set(["GET", "DELETE"]);
+
+// Longest delay, in milliseconds, waited before retrying a request
+const MAX_RETRY_DELAY = 10000;
+
+// Messages of the TypeError fetch rejects with when no response arrives
+// (browsers use "Failed to fetch", Node.js uses "fetch failed")
+const NETWORK_ERROR_MESSAGES = new Set(["Failed to fetch", "fetch failed"]);
+
+// Maximum number of record URLs kept by each client
+const RECORD_URL_CACHE_SIZE = 1024;
+
+// Maximum number of get responses kept by each client when caching is enabled
+const GET_CACHE_SIZE = 1024;
+
+// Largest number of records the API returns for a single range query
+const MAX_RANGE_LIMIT = 1000;
+
+// Error codes and messages by HTTP status; other 5xx statuses use the 500 entry
+const ERROR_CODES: Record<number, string> = {
+  400: "BAD_REQUEST",
+  401: "UNAUTHORIZED",
+  403: "FORBIDDEN",
+  404: "NOT_FOUND",
+  409: "CONFLICT",
+  429: "RATE_LIMIT_EXCEEDED",
+  500: "INTERNAL_ERROR",
+};
+
+const ERROR_MESSAGES: Record<number, string> = {
+  400: "Invalid parameters or request body",
+  401: "Missing or invalid API key",
+  403: "Permission denied",
+  404: "Record not found",
+  409: "Timestamp conflict",
+  429: "Rate limit exceeded",
+  500: "Server error",
+};
 
 /**
  * Client for interacting with the HPKV REST API
@@ -19,73 +67,295 @@ import {
  * - Nexus Search and Query capabilities
  */
 export class HPKVRestClient {
-  private baseUrl: string;
-  private nexusBaseUrl: string;
+  private recordUrl: string;
+  private atomicUrl: string;
+  private recordsUrl: string;
+  private searchUrl: string;
+  private queryUrl: string;
   private apiKey: string;
   private headers: Record<string, string>;
+  private jsonHeaders: Record<string, string>;
+  private fetchFn?: typeof fetch;
+  private timeout?: number;
+  private maxRetries: number;
+  private retryDelay: number;
+  private pendingGets: Map<string, Promise<RecordResponse>>;
+  private cacheTtl: number;
+  private getCache: Map<string, { expires: number; response: RecordResponse }>;
+  private activeWrites: Map<string, number>;
+  private recordUrls: Map<string, string>;
 
   /**
    * Creates a new HPKV client
    * @param baseUrl - The base URL for the HPKV REST API
    * @param nexusBaseUrl - The base URL for the HPKV Nexus API
    * @param apiKey - Your HPKV API key
-   * @throws {Error} When required parameters are missing
+   * @param options - Client options (fetch implementation, timeout, retries, caching)
+   * @throws {Error} When required parameters are missing or no fetch implementation is available
    */
-  constructor(baseUrl: string, nexusBaseUrl: string, apiKey: string) {
+  constructor(
+    baseUrl: string,
+    nexusBaseUrl: string,
+    apiKey: string,
+    options: ClientOptions = {},
+  ) {
     if (!baseUrl) throw new Error("baseUrl is required");
     if (!nexusBaseUrl) throw new Error("nexusBaseUrl is required");
     if (!apiKey) throw new Error("apiKey is required");
-    this.baseUrl = baseUrl;
-    this.nexusBaseUrl = nexusBaseUrl;
+    if (!options.fetch && typeof fetch !== "function") {
+      throw new Error(
+        "fetch is not available; use Node.js 18 or later or pass options.fetch",
+      );
+    }
+    this.recordUrl = `${baseUrl}/record`;
+    this.atomicUrl = `${baseUrl}/record/atomic`;
+    this.recordsUrl = `${baseUrl}/records`;
+    this.searchUrl = `${nexusBaseUrl}/search`;
+    this.queryUrl = `${nexusBaseUrl}/query`;
     this.apiKey = apiKey;
     this.headers = {
-      "Content-Type": "application/json",
+      Accept: "application/json",
       "x-api-key": this.apiKey,
     };
+    this.jsonHeaders = {
+      ...this.headers,
+      "Content-Type": "application/json",
+    };
+    this.fetchFn = options.fetch;
+    this.timeout = options.timeout;
+    this.maxRetries = options.maxRetries ?? 2;
+    this.retryDelay = options.retryDelay ?? 100;
+    this.pendingGets = new Map();
+    this.cacheTtl = options.cacheTtl ?? 0;
+    this.getCache = new Map();
+    this.activeWrites = new Map();
+    this.recordUrls = new Map();
   }
 
   /**
    * Make an HTTP request to the API
+   *
+   * Rate-limited requests (429) are retried for every method, and server
+   * errors (500, 502, 503, 504) for GET and DELETE, up to `maxRetries` times
+   * with jittered exponential backoff. The `timeout` option bounds the whole
+   * call, retries and the waits between them included.
+   *
    * @private
    * @param method - HTTP method (GET, POST, DELETE)
-   * @param path - API endpoint path
-   * @param options - Request options (body, etc.)
+   * @param url - Full URL of the API endpoint
+   * @param payload - Request body, serialized to JSON when present
    * @returns API response data
    * @throws {ApiError} When the API returns an error
    */
   private async _request<T>(
     method: string,
-    path: string,
-    options: RequestOptions = {},
+    url: string,
+    payload?: unknown,
   ): Promise<T> {
-    const baseUrl =
-      path.startsWith("/search") || path.startsWith("/query")
-        ? this.nexusBaseUrl
-        : this.baseUrl;
-    const url = `${baseUrl}${path}`;
-    const response = await fetch(url, {
-      method,
-      headers: this.headers,
-      ...options,
-    });
-
-    const data = await response.json().catch(() => ({}));
-
-    if (!response.ok) {
+    const body = payload === undefined ? undefined : JSON.stringify(payload);
+    const deadline = this.timeout ? Date.now() + this.timeout : Infinity;
+    const signal = this.timeout ? AbortSignal.timeout(this.timeout) : undefined;
+    for (let attempt = 0; ; attempt++) {
+      const response = await (this.fetchFn ?? fetch)(url, {
+        method,
+        headers: body === undefined ? this.headers : this.jsonHeaders,
+        body,
+        signal,
+      });
+
+      const data = await this._parseBody(response);
+      if (response.ok) return data as T;
+
+      const delay =
+        attempt < this.maxRetries && this._isRetryable(method, response.status)
+          ? this._getRetryDelay(attempt, response, deadline)
+          : undefined;
+      if (delay !== undefined) {
+        await sleep(delay, signal);
+        continue;
+      }
+
       const errorData =
         typeof data === "object" && data !== null
           ? (data as Record<string, unknown>)
           : {};
-      const error = new Error(
-        (errorData.error as string) || `HTTP error ${response.status}`,
-      ) as ApiError;
-      error.status = response.status;
-      error.data = errorData;
-      error.code = this._getErrorCode(response.status);
-      throw error;
+      throw new HPKVError(
+        this._getErrorMessage(response.status, errorData),
+        response.status,
+        this._getErrorCode(response.status),
+        errorData,
+      );
+    }
+  }
+
+  /**
+   * Check whether a failed request can be retried
+   * @private
+   * @param method - HTTP method of the request
+   * @param status - HTTP status code of the response
+   * @returns True if the request is safe to send again
+   */
+  private _isRetryable(method: string, status: number): boolean {
+    return (
+      status === 429 ||
+      (RETRYABLE_STATUSES.has(status) && IDEMPOTENT_METHODS.has(method))
+    );
+  }
+
+  /**
+   * Get the delay before the next retry
+   *
+   * Uses the Retry-After header (in seconds or as an HTTP date) when the
+   * server sends one, otherwise doubles `retryDelay` on every attempt and
+   * adds up to the same amount of jitter.
+   * Backoff delays are capped at 10 seconds, or at the time left before the
+   * call's deadline when that is shorter. A Retry-After beyond that cap is
+   * not waited for at all, so the request fails straight away instead of
+   * stalling the caller.
+   *
+   * @private
+   * @param attempt - Zero-based number of the attempt that failed
+   * @param response - The failed response
+   * @param deadline - Time by which the call must finish, in epoch ms
+   * @returns Delay in milliseconds, or undefined if the server asks for a
+   *   longer wait than the client allows
+   */
+  private _getRetryDelay(
+    attempt: number,
+    response: Response,
+    deadline: number,
+  ): number | undefined {
+    const limit = Math.min(MAX_RETRY_DELAY, deadline - Date.now());
+    const retryAfter = response.headers.get("Retry-After");
+    if (retryAfter) {
+      // Either a number of seconds or an HTTP date
+      const seconds = Number(retryAfter);
+      const delay = Number.isNaN(seconds)
+        ? Date.parse(retryAfter) - Date.now()
+        : seconds * 1000;
+      if (delay > 0) return delay <= limit ? delay : undefined;
+    }
+    const delay = this.retryDelay * 2 ** attempt;
+    return Math.min(delay + Math.random() * delay, limit);
+  }
+
+  /**
+   * Parse a JSON response body
+   *
+   * Reads the body once as text and only hands non-empty payloads to
+   * `JSON.parse`, so empty bodies don't go through a thrown-and-caught
+   * SyntaxError. Responses without a body (204, or an explicit zero
+   * Content-Length) are not read at all, and error responses that aren't
+   * declared as JSON (e.g. plain-text or HTML pages from a proxy) are not
+   * parsed.
+   *
+   * @private
+   * @param response - The fetch response
+   * @returns Parsed body, or an empty object when the body is empty or not JSON
+   */
+  private async _parseBody(response: Response): Promise<unknown> {
+    if (
+      response.status === 204 ||
+      response.headers.get("Content-Length") === "0"
+    ) {
+      return {};
+    }
+    const text = await response.text();
+    if (!text) return {};
+    if (
+      !response.ok &&
+      !response.headers.get("Content-Type")?.includes("json")
+    ) {
+      return {};
+    }
+    try {
+      return JSON.parse(text);
+    } catch {
+      return {};
+    }
+  }
+
+  /**
+   * Convert a record value to the string form stored by the API
+   *
+   * The API stores values as strings, so non-string values are stringified
+   * once here and the result is embedded in the request payload. Finite
+   * numbers, booleans and null are converted directly, which gives the same
+   * text as `JSON.stringify` without going through the serializer.
+   *
+   * @private
+   * @param value - The value to store
+   * @returns The value as a string
+   */
+  private _serializeValue(value: unknown): string {
+    switch (typeof value) {
+      case "string":
+        return value;
+      case "boolean":
+        return value ? "true" : "false";
+      case "number":
+        if (Number.isFinite(value)) return String(value);
+        break;
+      case "object":
+        if (value === null) return "null";
+        break;
     }
+    return JSON.stringify(value);
+  }
+
+  /**
+   * Build the request payload shared by Nexus Search and Nexus Query
+   *
+   * @private
+   * @param query - The search or query text
+   * @param options - Search options (topK, minScore)
+   * @returns Payload with topK clamped to 1-20 and minScore clamped to 0-1
+   */
+  private _nexusPayload(
+    query: string,
+    options: SearchOptions,
+  ): Required<SearchOptions> & { query: string } {
+    return {
+      query,
+      topK: Math.min(Math.max(options.topK || 5, 1), 20),
+      minScore: Math.min(Math.max(options.minScore || 0.5, 0), 1),
+    };
+  }
+
+  /**
+   * URI-encode a key
+   *
+   * Same result as encodeURIComponent, but keys made only of characters it
+   * leaves as-is are returned directly instead of being re-encoded.
+   *
+   * @private
+   * @param key - The record key
+   * @returns The encoded key
+   */
+  private _encodeKey(key: string): string {
+    return URI_SAFE_KEY.test(key) ? key : encodeURIComponent(key);
+  }
+
+  /**
+   * Build the URL of a single record
+   *
+   * URLs of recently used keys are cached, evicting the oldest entry once the
+   * cache is full.
+   *
+   * @private
+   * @param key - The record key
+   * @returns URL of the record endpoint for the key
+   */
+  private _recordUrl(key: string): string {
+    let url = this.recordUrls.get(key);
+    if (url !== undefined) return url;
 
-    return data as T;
+    url = `${this.recordUrl}/${this._encodeKey(key)}`;
+    if (this.recordUrls.size >= RECORD_URL_CACHE_SIZE) {
+      this.recordUrls.delete(this.recordUrls.keys().next().value as string);
+    }
+    this.recordUrls.set(key, url);
+    return url;
   }
 
   /**
@@ -95,16 +365,10 @@ export class HPKVRestClient {
    * @returns Error code
    */
   private _getErrorCode(status: number): string {
-    const errorCodes: Record<number, string> = {
-      400: "BAD_REQUEST",
-      401: "UNAUTHORIZED",
-      403: "FORBIDDEN",
-      404: "NOT_FOUND",
-      409: "CONFLICT",
-      429: "RATE_LIMIT_EXCEEDED",
-      500: "INTERNAL_ERROR",
-    };
-    return errorCodes[status] || "UNKNOWN_ERROR";
+    return (
+      ERROR_CODES[status] ||
+      (status >= 500 ? ERROR_CODES[500] : "UNKNOWN_ERROR")
+    );
   }
 
   /**
@@ -135,13 +399,13 @@ export class HPKVRestClient {
     partialUpdate = false,
   ): Promise<RecordResponse> {
     try {
-      return await this._request<RecordResponse>("POST", "/record", {
-        body: JSON.stringify({
+      return await this._write(key, () =>
+        this._request<RecordResponse>("POST", this.recordUrl, {
           key,
-          value: typeof value === "string" ? value : JSON.stringify(value),
+          value: this._serializeValue(value),
           partialUpdate,
         }),
-      });
+      );
     } catch (error) {
       this._handleError(error as ApiError);
     }
@@ -150,18 +414,108 @@ export class HPKVRestClient {
   /**
    * Get a record by key
    *
-   * Retrieves the value stored at the specified key.
+   * Retrieves the value stored at the specified key. Concurrent calls for the
+   * same key share a single request. When the `cacheTtl` option is set,
+   * responses are also reused for that many milliseconds. A `set`, `delete`
+   * or `atomicIncrement` of the key through this client discards both, and
+   * reads that overlap such a write are never cached, so later calls fetch
+   * the record again. Every call resolves with its own copy of the response.
    *
    * @param key - The key to retrieve
    * @returns Response containing the key and value
    * @throws {ApiError} When the API returns an error (404 Not Found if key doesn't exist)
    */
   async get(key: string): Promise<RecordResponse> {
+    if (this.cacheTtl > 0) {
+      const cached = this.getCache.get(key);
+      if (cached && cached.expires > Date.now()) return { ...cached.response };
+    }
+
+    const pending = this.pendingGets.get(key);
+    if (pending) return pending.then((response) => ({ ...response }));
+    const request: Promise<RecordResponse> = this._getRecord(key)
+      .then((response) => {
+        // Only cache if no write to the key overlapped the request
+        if (
+          this.cacheTtl > 0 &&
+          this.pendingGets.get(key) === request &&
+          !this.activeWrites.has(key)
+        ) {
+          this._cacheResponse(key, { ...response });
+        }
+        return response;
+      })
+      .finally(() => {
+        if (this.pendingGets.get(key) === request) this.pendingGets.delete(key);
+      });
+    this.pendingGets.set(key, request);
+    return request;
+  }
+
+  /**
+   * Store a get response in the cache
+   *
+   * @private
+   * @param key - The record key
+   * @param response - The response to cache
+   */
+  private _cacheResponse(key: string, response: RecordResponse): void {
+    this.getCache.delete(key);
+    if (this.getCache.size >= GET_CACHE_SIZE) {
+      this.getCache.delete(this.getCache.keys().next().value as string);
+    }
+    this.getCache.set(key, { expires: Date.now() + this.cacheTtl, response });
+  }
+
+  /**
+   * Discard pending and cached reads of a key
+   *
+   * @private
+   * @param key - The record key
+   */
+  private _invalidate(key: string): void {
+    this.pendingGets.delete(key);
+    this.getCache.delete(key);
+  }
+
+  /**
+   * Run a write to a key, discarding reads of the key around it
+   *
+   * Reads are discarded both when the write starts and when it settles, since
+   * a read that runs while the write is in flight may see the old value.
+   *
+   * @private
+   * @param key - The record key
+   * @param write - Sends the write request
+   * @returns Response of the write
+   */
+  private async _write(
+    key: string,
+    write: () => Promise<RecordResponse>,
+  ): Promise<RecordResponse> {
+    this._invalidate(key);
+    this.activeWrites.set(key, (this.activeWrites.get(key) ?? 0) + 1);
     try {
-      return await this._request<RecordResponse>(
-        "GET",
-        `/record/${encodeURIComponent(key)}`,
-      );
+      return await write();
+    } finally {
+      const writes = (this.activeWrites.get(key) ?? 1) - 1;
+      if (writes > 0) this.activeWrites.set(key, writes);
+      else this.activeWrites.delete(key);
+      this._invalidate(key);
+    }
+  }
+
+  /**
+   * Fetch a record from the API
+   *
+   * @private
+   * @param key - The key to retrieve
+   * @returns Response containing the key and value
+   * @throws {ApiError} When the API returns an error
+   */
+  private async _getRecord(key: string): Promise<RecordResponse> {
+    try {
+      return await this._request<RecordResponse>("GET", this._recordUrl(key));
     } catch (error) {
       this._handleError(error as ApiError);
     }
@@ -178,9 +532,8 @@ export class HPKVRestClient {
    */
   async delete(key: string): Promise<RecordResponse> {
     try {
-      return await this._request<RecordResponse>(
-        "DELETE",
-        `/record/${encodeURIComponent(key)}`,
+      return await this._write(key, () =>
+        this._request<RecordResponse>("DELETE", this._recordUrl(key)),
       );
     } catch (error) {
       this._handleError(error as ApiError);
@@ -214,12 +567,12 @@ export class HPKVRestClient {
     increment: number,
   ): Promise<RecordResponse> {
     try {
-      return await this._request<RecordResponse>("POST", "/record/atomic", {
-        body: JSON.stringify({
+      return await this._write(key, () =>
+        this._request<RecordResponse>("POST", this.atomicUrl, {
           key,
           increment,
         }),
-      });
+      );
     } catch (error) {
       this._handleError(error as ApiError);
     }
@@ -230,7 +583,8 @@ export class HPKVRestClient {
    *
    * Retrieves multiple records with keys that fall within the specified range.
    * This is useful for retrieving related data with similar keys, such as all users
-   * with IDs in a certain range.
+   * with IDs in a certain range. Fields missing from the API response are
+   * filled with defaults, so the result always has the declared shape.
    *
    * @param startKey - Starting key for the range (inclusive)
    * @param endKey - Ending key for the range (inclusive)
@@ -245,16 +599,142 @@ export class HPKVRestClient {
   ): Promise<RangeResponse> {
     try {
       const params = new URLSearchParams({
-        startKey: encodeURIComponent(startKey),
-        endKey: encodeURIComponent(endKey),
+        startKey: this._encodeKey(startKey),
+        endKey: this._encodeKey(endKey),
         limit: limit.toString(),
       });
-      return await this._request<RangeResponse>("GET", `/records?${params}`);
+      const data = await this._request<Partial<RangeResponse>>(
+        "GET",
+        `${this.recordsUrl}?${params}`,
+      );
+      const records = Array.isArray(data.records) ? data.records : [];
+      return {
+        records,
+        count: data.count ?? records.length,
+        truncated: data.truncated ?? false,
+      };
     } catch (error) {
       this._handleError(error as ApiError);
     }
   }
 
+  /**
+   * Iterate over all records within a key range
+   *
+   * Fetches the range one page at a time and yields records as it goes, so
+   * large ranges are never held in memory at once and iteration can stop
+   * early without fetching the remaining pages.
+   *
+   * @param startKey - Starting key for the range (inclusive)
+   * @param endKey - Ending key for the range (inclusive)
+   * @param pageSize - Number of records fetched per request (default: 100, clamped to 2-1000)
+   * @returns Async iterator over the records in key order
+   * @throws {ApiError} When the API returns an error
+   *
+   * @example
+   * for await (const record of client.scan("users:000", "users:999")) {
+   *   console.log(record.key, record.value);
+   * }
+   */
+  async *scan(
+    startKey: string,
+    endKey: string,
+    pageSize = 100,
+  ): AsyncGenerator<RangeRecord, void, undefined> {
+    // Each page after the first starts at the last key already yielded, so
+    // a page needs at least two records to make progress
+    const limit = Math.min(Math.max(pageSize, 2), MAX_RANGE_LIMIT);
+    let from = startKey;
+    let lastKey: string | undefined;
+    for (;;) {
+      const page = await this.range(from, endKey, limit);
+      for (const record of page.records) {
+        if (record.key !== lastKey) yield record;
+      }
+      if (!page.truncated || page.records.length === 0) return;
+      from = lastKey = page.records[page.records.length - 1].key;
+    }
+  }
+
+  /**
+   * Insert or update multiple records
+   *
+   * Issues the `set` calls concurrently, keeping at most `concurrency` requests
+   * in flight, so a batch of N records costs roughly N / concurrency round-trips
+   * instead of N.
+   *
+   * @param items - Map of keys to values (strings or objects that will be stringified)
+   * @param partialUpdate - If true, apply a partial update to every record
+   * @param concurrency - Maximum number of requests in flight (default: 16)
+   * @returns Responses in the same order as the entries of `items`
+   * @throws {ApiError} When the API returns an error for any of the records
+   *
+   * @example
+   * await client.multiSet({ "users:001": "Alice", "users:002": "Bob" });
+   */
+  async multiSet(
+    items: Record<string, unknown>,
+    partialUpdate = false,
+    concurrency = 16,
+  ): Promise<RecordResponse[]> {
+    return mapConcurrent(Object.entries(items), concurrency, ([key, value]) =>
+      this.set(key, value, partialUpdate),
+    );
+  }
+
+  /**
+   * Get multiple records by key
+   *
+   * Issues the `get` calls concurrently, keeping at most `concurrency` requests
+   * in flight.
+   *
+   * @param keys - The keys to retrieve
+   * @param concurrency - Maximum number of requests in flight (default: 16)
+   * @returns Responses in the same order as `keys`
+   * @throws {ApiError} When the API returns an error for any of the keys
+   */
+  async multiGet(keys: string[], concurrency = 16): Promise<RecordResponse[]> {
+    return mapConcurrent(keys, concurrency, (key) => this.get(key));
+  }
+
+  /**
+   * Delete multiple records
+   *
+   * Issues the `delete` calls concurrently, keeping at most `concurrency`
+   * requests in flight.
+   *
+   * @param keys - The keys to delete
+   * @param concurrency - Maximum number of requests in flight (default: 16)
+   * @returns Responses in the same order as `keys`
+   * @throws {ApiError} When the API returns an error for any of the keys
+   */
+  async multiDelete(
+    keys: string[],
+    concurrency = 16,
+  ): Promise<RecordResponse[]> {
+    return mapConcurrent(keys, concurrency, (key) => this.delete(key));
+  }
+
+  /**
+   * Create a pipeline for queuing record operations
+   *
+   * Operations queued on the pipeline are sent when `exec()` is called, with at
+   * most `concurrency` requests in flight.
+   *
+   * @param concurrency - Maximum number of requests in flight (default: 16)
+   * @returns A new pipeline bound to this client
+   *
+   * @example
+   * const [setResult, getResult] = await client
+   *   .pipeline()
+   *   .set("user:123", { name: "John" })
+   *   .get("user:456")
+   *   .exec();
+   */
+  pipeline(concurrency = 16): HPKVPipeline {
+    return new HPKVPipeline(this, concurrency);
+  }
+
   /**
    * Perform semantic search using Nexus Search
    *
@@ -272,15 +752,11 @@ export class HPKVRestClient {
   ): Promise<SearchResponse> {
     try {
       if (!query) throw new Error("Query is required");
-      const body = {
-        query,
-        topK: Math.min(Math.max(options.topK || 5, 1), 20),
-        minScore: Math.min(Math.max(options.minScore || 0.5, 0), 1),
-      };
-
-      return await this._request<SearchResponse>("POST", "/search", {
-        body: JSON.stringify(body),
-      });
+      return await this._request<SearchResponse>(
+        "POST",
+        this.searchUrl,
+        this._nexusPayload(query, options),
+      );
     } catch (error) {
       this._handleError(error as ApiError);
     }
@@ -303,15 +779,11 @@ export class HPKVRestClient {
   ): Promise<QueryResponse> {
     try {
       if (!query) throw new Error("Query is required");
-      const body = {
-        query,
-        topK: Math.min(Math.max(options.topK || 5, 1), 20),
-        minScore: Math.min(Math.max(options.minScore || 0.5, 0), 1),
-      };
-
-      return await this._request<QueryResponse>("POST", "/query", {
-        body: JSON.stringify(body),
-      });
+      return await this._request<QueryResponse>(
+        "POST",
+        this.queryUrl,
+        this._nexusPayload(query, options),
+      );
     } catch (error) {
       this._handleError(error as ApiError);
     }
@@ -320,27 +792,25 @@ export class HPKVRestClient {
   /**
    * Handle API errors
    *
+   * API errors already carry their final message from `_request` and are
+   * rethrown as-is; only network failures and timeouts are translated here.
+   *
    * @private
    * @param error - The API error to handle
    * @throws {ApiError} Enhanced error with additional context
    */
   private _handleError(error: ApiError): never {
-    if (error.status) {
-      const errorMessage = this._getErrorMessage(error.status, error.data);
-      const enhancedError = new Error(errorMessage) as ApiError;
-      enhancedError.status = error.status;
-      enhancedError.code = error.code;
-      enhancedError.data = error.data;
-      throw enhancedError;
-    } else if (error.message === "Failed to fetch") {
-      const networkError = new Error(
+    if (!error.status && NETWORK_ERROR_MESSAGES.has(error.message)) {
+      throw new HPKVError(
         "No response received from server",
-      ) as ApiError;
-      networkError.code = "NETWORK_ERROR";
-      throw networkError;
-    } else {
-      throw error;
+        undefined,
+        "NETWORK_ERROR",
+      );
+    }
+    if (error.name === "TimeoutError") {
+      throw new HPKVError("Request timed out", undefined, "TIMEOUT");
     }
+    throw error;
   }
 
   /**
@@ -352,20 +822,10 @@ export class HPKVRestClient {
    * @returns Human-readable error message
    */
   private _getErrorMessage(status: number, data: unknown): string {
-    const messages: Record<number, string> = {
-      400: "Invalid parameters or request body",
-      401: "Missing or invalid API key",
-      403: "Permission denied",
-      404: "Record not found",
-      409: "Timestamp conflict",
-      429: "Rate limit exceeded",
-      500: "Server error",
-    };
-
     return (
       (data as { error?: string })?.error ||
-      messages[status] ||
-      `HTTP error ${status}`
+      ERROR_MESSAGES[status] ||
+      (status >= 500 ? ERROR_MESSAGES[500] : `HTTP error ${status}`)
     );
   }
 }
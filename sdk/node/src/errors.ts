@@ -0,0 +1,35 @@
+import { ApiError } from "./types";
+
+/**
+ * Error thrown by the HPKV client
+ *
+ * All fields are assigned in the constructor so every instance shares the
+ * same shape, instead of growing properties one by one on a plain `Error`.
+ * `name` lives on the prototype rather than on each instance.
+ */
+export class HPKVError extends Error implements ApiError {
+  status?: number;
+  code?: string;
+  data?: Record<string, unknown>;
+
+  /**
+   * Creates a new HPKV error
+   * @param message - Human-readable error message
+   * @param status - HTTP status code, if the error came from an API response
+   * @param code - Error code (e.g. NOT_FOUND, NETWORK_ERROR)
+   * @param data - Error data returned by the API
+   */
+  constructor(
+    message: string,
+    status?: number,
+    code?: string,
+    data?: Record<string, unknown>,
+  ) {
+    super(message);
+    this.status = status;
+    this.code = code;
+    this.data = data;
+  }
+}
+
+HPKVError.prototype.name = "HPKVError";
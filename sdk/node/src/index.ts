@@ -1,2 +1,8 @@
-export { HPKVRestClient } from "./client";
+import { HPKVRestClient } from "./client";
+
+export { HPKVRestClient };
+export { HPKVError } from "./errors";
+export { HPKVPipeline } from "./pipeline";
 export * from "./types";
+
+export default HPKVRestClient;
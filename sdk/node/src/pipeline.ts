@@ -0,0 +1,94 @@
+import type { HPKVRestClient } from "./client";
+import { RecordResponse } from "./types";
+import { mapConcurrent } from "./utils";
+
+/**
+ * Queue of record operations sent together with bounded concurrency
+ *
+ * Create one with `HPKVRestClient.pipeline()`, queue operations with the
+ * chainable methods, then call `exec()` to send them.
+ */
+export class HPKVPipeline {
+  private client: HPKVRestClient;
+  private concurrency: number;
+  private operations: Array<() => Promise<RecordResponse>>;
+
+  /**
+   * Creates a new pipeline
+   * @param client - The client used to send the operations
+   * @param concurrency - Maximum number of requests in flight
+   */
+  constructor(client: HPKVRestClient, concurrency: number) {
+    this.client = client;
+    this.concurrency = concurrency;
+    this.operations = [];
+  }
+
+  /**
+   * Number of queued operations
+   */
+  get length(): number {
+    return this.operations.length;
+  }
+
+  /**
+   * Queue an insert or update of a record
+   * @param key - The key to store the value under
+   * @param value - The value to store (string or object that will be stringified)
+   * @param partialUpdate - If true, append to existing value or apply JSON patch
+   * @returns This pipeline
+   */
+  set(key: string, value: unknown, partialUpdate = false): this {
+    this.operations.push(() => this.client.set(key, value, partialUpdate));
+    return this;
+  }
+
+  /**
+   * Queue a read of a record
+   * @param key - The key to retrieve
+   * @returns This pipeline
+   */
+  get(key: string): this {
+    this.operations.push(() => this.client.get(key));
+    return this;
+  }
+
+  /**
+   * Queue a deletion of a record
+   * @param key - The key to delete
+   * @returns This pipeline
+   */
+  delete(key: string): this {
+    this.operations.push(() => this.client.delete(key));
+    return this;
+  }
+
+  /**
+   * Queue an atomic increment or decrement of a numeric value
+   * @param key - The key containing the numeric value
+   * @param increment - Value to add (positive) or subtract (negative)
+   * @returns This pipeline
+   */
+  atomicIncrement(key: string, increment: number): this {
+    this.operations.push(() => this.client.atomicIncrement(key, increment));
+    return this;
+  }
+
+  /**
+   * Send all queued operations and empty the queue
+   *
+   * Operations are started in the order they were queued, with at most
+   * `concurrency` requests in flight, so operations on the same key are not
+   * guaranteed to complete in order.
+   *
+   * @returns Responses in the order the operations were queued
+   * @throws {ApiError} When the API returns an error for any of the operations
+   */
+  async exec(): Promise<RecordResponse[]> {
+    const operations = this.operations;
+    this.operations = [];
+    return mapConcurrent(operations, this.concurrency, (operation) =>
+      operation(),
+    );
+  }
+}
@@ -1,3 +1,11 @@
+export interface ClientOptions {
+  fetch?: typeof fetch;
+  timeout?: number;
+  maxRetries?: number;
+  retryDelay?: number;
+  cacheTtl?: number;
+}
+
 export interface RequestOptions {
   body?: string;
   headers?: Record<string, string>;
@@ -14,6 +22,8 @@ export interface RecordResponse {
   key: string;
   value: string;
   result?: number;
+  success?: boolean;
+  message?: string;
 }
 
 export interface SearchResponse {
@@ -31,11 +41,13 @@ export interface QueryResponse {
   }>;
 }
 
+export interface RangeRecord {
+  key: string;
+  value: string;
+}
+
 export interface RangeResponse {
-  records: Array<{
-    key: string;
-    value: string;
-  }>;
+  records: RangeRecord[];
   count: number;
   truncated: boolean;
 }
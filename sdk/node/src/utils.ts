@@ -0,0 +1,57 @@
+/**
+ * Run an async operation over a list of items with bounded concurrency
+ *
+ * Stops starting new operations as soon as one rejects; operations already
+ * in flight are left to settle.
+ *
+ * @param items - Items to process
+ * @param concurrency - Maximum number of operations in flight (at least 1)
+ * @param fn - Operation to run for each item
+ * @returns Results in the same order as `items`
+ */
+export async function mapConcurrent<T, R>(
+  items: T[],
+  concurrency: number,
+  fn: (item: T) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  // Once any operation fails, stop starting new ones
+  let aborted = false;
+  const worker = async (): Promise<void> => {
+    while (!aborted && next < items.length) {
+      const index = next++;
+      try {
+        results[index] = await fn(items[index]);
+      } catch (error) {
+        aborted = true;
+        throw error;
+      }
+    }
+  };
+  const limit = Math.max(1, Math.floor(concurrency) || 1);
+  const workers = Math.min(limit, items.length);
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
+
+/**
+ * Wait for a number of milliseconds
+ *
+ * @param ms - How long to wait
+ * @param signal - Cuts the wait short, rejecting with the signal's reason
+ */
+export function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) return reject(signal.reason);
+    const onAbort = () => {
+      clearTimeout(timer);
+      reject(signal?.reason);
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener("abort", onAbort);
+      resolve();
+    }, ms);
+    signal?.addEventListener("abort", onAbort, { once: true });
+  });
+}
@@ -0,0 +1,315 @@
+import { describe, test, expect } from "@jest/globals";
+import { HPKVRestClient } from "../src/client";
+import { ClientOptions } from "../src/types";
+
+// Offline tests against a stubbed fetch; no API credentials are needed
+describe("HPKVClient Unit Tests", () => {
+  describe("Client Behaviour", () => {
+    type Handler = (
+      url: string,
+      init: RequestInit,
+    ) => Response | Promise<Response>;
+
+    // Client whose requests are answered by `handler` instead of the API
+    const stubClient = (
+      handler: Handler,
+      options: ClientOptions = {},
+    ): HPKVRestClient =>
+      new HPKVRestClient(
+        "https://hpkv.test",
+        "https://nexus.hpkv.test",
+        "test-key",
+        {
+          fetch: async (input, init) => handler(String(input), init ?? {}),
+          ...options,
+        },
+      );
+
+    const json = (
+      body: unknown,
+      status = 200,
+      headers: Record<string, string> = {},
+    ): Response =>
+      new Response(JSON.stringify(body), {
+        status,
+        headers: { "Content-Type": "application/json", ...headers },
+      });
+
+    test("should stop starting batch operations after a failure", async () => {
+      const started: string[] = [];
+      const stub = stubClient(async (url, init) => {
+        const { key } = JSON.parse(String(init.body));
+        started.push(key);
+        if (key === "a") return json({ error: "Invalid value" }, 400);
+        await new Promise((resolve) => setTimeout(resolve, 20));
+        return json({ success: true });
+      });
+
+      await expect(
+        stub.multiSet({ a: "1", b: "2", c: "3", d: "4" }, false, 2),
+      ).rejects.toMatchObject({ status: 400 });
+      await new Promise((resolve) => setTimeout(resolve, 50));
+      expect(started).toEqual(["a", "b"]);
+    });
+
+    test("should treat an invalid concurrency as 1", async () => {
+      const stub = stubClient((url) =>
+        json({ key: url.split("/").pop(), value: "v" }),
+      );
+
+      const results = await stub.multiGet(["a", "b"], NaN);
+      expect(results.map((result) => result.key)).toEqual(["a", "b"]);
+    });
+
+    test("should share one request between concurrent gets", async () => {
+      let calls = 0;
+      const stub = stubClient(async () => {
+        calls++;
+        await new Promise((resolve) => setTimeout(resolve, 10));
+        return json({ key: "a", value: "v" });
+      });
+
+      const [first, second] = await Promise.all([stub.get("a"), stub.get("a")]);
+      expect(first.value).toBe("v");
+      expect(second.value).toBe("v");
+      expect(calls).toBe(1);
+
+      await stub.get("a");
+      expect(calls).toBe(2);
+    });
+
+    test("should reject with a TIMEOUT error when a request times out", async () => {
+      const stub = stubClient(
+        (url, init) =>
+          new Promise<Response>((resolve, reject) => {
+            init.signal?.addEventListener("abort", () =>
+              reject(init.signal?.reason),
+            );
+          }),
+        { timeout: 10, maxRetries: 0 },
+      );
+
+      await expect(stub.get("a")).rejects.toMatchObject({
+        name: "HPKVError",
+        code: "TIMEOUT",
+      });
+    });
+
+    test("should apply the timeout to the whole call, retries included", async () => {
+      let calls = 0;
+      const stub = stubClient(
+        (url, init) =>
+          new Promise<Response>((resolve, reject) => {
+            calls++;
+            const timer = setTimeout(
+              () => resolve(json({ error: "Unavailable" }, 503)),
+              40,
+            );
+            init.signal?.addEventListener("abort", () => {
+              clearTimeout(timer);
+              reject(init.signal?.reason);
+            });
+          }),
+        { timeout: 50, retryDelay: 100 },
+      );
+
+      const started = Date.now();
+      await expect(stub.get("a")).rejects.toMatchObject({ code: "TIMEOUT" });
+      expect(Date.now() - started).toBeLessThan(150);
+      expect(calls).toBe(1);
+    });
+
+    test("should clamp the scan page size to the API's range limit", async () => {
+      const limits: string[] = [];
+      const stub = stubClient((url) => {
+        limits.push(new URL(url).searchParams.get("limit") ?? "");
+        return json({ records: [], count: 0, truncated: false });
+      });
+
+      const records = [];
+      for await (const record of stub.scan("a", "z", 5000)) {
+        records.push(record);
+      }
+      expect(records).toHaveLength(0);
+      expect(limits).toEqual(["1000"]);
+    });
+
+    describe("with caching", () => {
+      const sleep = (ms: number) =>
+        new Promise((resolve) => setTimeout(resolve, ms));
+
+      // Stub API backed by an in-memory store; writes take `writeDelay` ms
+      const storeClient = (cacheTtl: number, writeDelay = 0) => {
+        const store = new Map([["a", "old"]]);
+        const stats = { gets: 0 };
+        const stub = stubClient(
+          async (url, init) => {
+            if (init.method === "GET") {
+              stats.gets++;
+              const key = decodeURIComponent(url.split("/").pop() ?? "");
+              return json({ key, value: store.get(key) });
+            }
+            const { key, value } = JSON.parse(String(init.body));
+            await sleep(writeDelay);
+            store.set(key, value);
+            return json({ success: true });
+          },
+          { cacheTtl },
+        );
+        return { stub, stats };
+      };
+
+      test("should reuse a response until it expires", async () => {
+        const { stub, stats } = storeClient(30);
+
+        await stub.get("a");
+        await stub.get("a");
+        expect(stats.gets).toBe(1);
+
+        await sleep(40);
+        await stub.get("a");
+        expect(stats.gets).toBe(2);
+      });
+
+      test("should discard a cached response when the key is written", async () => {
+        const { stub, stats } = storeClient(60000);
+
+        await stub.get("a");
+        await stub.set("a", "new");
+        const result = await stub.get("a");
+        expect(result.value).toBe("new");
+        expect(stats.gets).toBe(2);
+      });
+
+      test("should not cache a read that overlaps a write", async () => {
+        const { stub } = storeClient(60000, 20);
+
+        await stub.pipeline().set("a", "new").get("a").exec();
+        const result = await stub.get("a");
+        expect(result.value).toBe("new");
+      });
+
+      test("should give every caller its own copy of a response", async () => {
+        const { stub, stats } = storeClient(60000);
+
+        const [first, second] = await Promise.all([
+          stub.get("a"),
+          stub.get("a"),
+        ]);
+        first.value = "changed";
+        expect(second.value).toBe("old");
+
+        const third = await stub.get("a");
+        third.value = "changed";
+        expect((await stub.get("a")).value).toBe("old");
+        expect(stats.gets).toBe(1);
+      });
+    });
+
+    test("should reject with a NETWORK_ERROR when fetch fails", async () => {
+      const stub = stubClient(() => {
+        throw new TypeError("fetch failed");
+      });
+
+      await expect(stub.get("a")).rejects.toMatchObject({
+        name: "HPKVError",
+        code: "NETWORK_ERROR",
+      });
+    });
+
+    test("should reject with an HPKVError for a non-JSON error body", async () => {
+      const stub = stubClient(
+        () =>
+          new Response("<html>Bad Gateway</html>", {
+            status: 502,
+            headers: { "Content-Type": "text/html" },
+          }),
+        { maxRetries: 0 },
+      );
+
+      await expect(stub.get("a")).rejects.toMatchObject({
+        name: "HPKVError",
+        message: "Server error",
+        status: 502,
+        code: "INTERNAL_ERROR",
+      });
+    });
+
+    test("should retry rate-limited writes", async () => {
+      let calls = 0;
+      const stub = stubClient(
+        () =>
+          ++calls === 1
+            ? json({ error: "Too many requests" }, 429)
+            : json({ success: true }),
+        { retryDelay: 1 },
+      );
+
+      await stub.set("a", "v");
+      expect(calls).toBe(2);
+    });
+
+    test("should not retry writes that fail with a server error", async () => {
+      let calls = 0;
+      const stub = stubClient(
+        () => {
+          calls++;
+          return json({ error: "Unavailable" }, 503);
+        },
+        { retryDelay: 1 },
+      );
+
+      await expect(stub.set("a", "v")).rejects.toMatchObject({ status: 503 });
+      expect(calls).toBe(1);
+    });
+
+    test("should retry reads that fail with a server error", async () => {
+      let calls = 0;
+      const stub = stubClient(
+        () => {
+          calls++;
+          return json({ error: "Unavailable" }, 503);
+        },
+        { retryDelay: 1, maxRetries: 3 },
+      );
+
+      await expect(stub.get("a")).rejects.toMatchObject({ status: 503 });
+      expect(calls).toBe(4);
+    });
+
+    test("should honour Retry-After up to the retry delay cap", async () => {
+      let calls = 0;
+      const rateLimited = (retryAfter: string) =>
+        stubClient(() =>
+          ++calls === 1
+            ? json({ error: "Too many requests" }, 429, {
+                "Retry-After": retryAfter,
+              })
+            : json({ key: "a", value: "v" }),
+        );
+
+      const started = Date.now();
+      await rateLimited("0.05").get("a");
+      expect(calls).toBe(2);
+      expect(Date.now() - started).toBeGreaterThanOrEqual(45);
+
+      calls = 0;
+      await expect(rateLimited("3600").get("a")).rejects.toMatchObject({
+        code: "RATE_LIMIT_EXCEEDED",
+      });
+      expect(calls).toBe(1);
+
+      calls = 0;
+      const inAnHour = new Date(Date.now() + 3600 * 1000).toUTCString();
+      await expect(rateLimited(inAnHour).get("a")).rejects.toMatchObject({
+        code: "RATE_LIMIT_EXCEEDED",
+      });
+      expect(calls).toBe(1);
+
+      calls = 0;
+      const past = new Date(Date.now() - 3600 * 1000).toUTCString();
+      await rateLimited(past).get("a");
+      expect(calls).toBe(2);
+    });
+  });
+});
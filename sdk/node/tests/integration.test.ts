@@ -74,6 +74,55 @@ describe("HPKVClient Integration Tests", () => {
     });
   });
 
+  describe("Batch Operations", () => {
+    const testKeys: string[] = [];
+
+    afterAll(async () => {
+      await cleanup(testKeys);
+    });
+
+    test("should set, get and delete multiple records", async () => {
+      const items = {
+        [getTestKey("batch:1")]: "One",
+        [getTestKey("batch:2")]: "Two",
+        [getTestKey("batch:3")]: "Three",
+      };
+      const keys = Object.keys(items);
+      testKeys.push(...keys);
+
+      await client.multiSet(items, false, 2);
+      const results = await client.multiGet(keys, 2);
+      expect(results.map((record) => record.value)).toEqual([
+        "One",
+        "Two",
+        "Three",
+      ]);
+
+      await client.multiDelete(keys, 2);
+      await expect(client.get(keys[0])).rejects.toThrow();
+    });
+
+    test("should return pipeline results in queue order and empty the queue", async () => {
+      const key = getTestKey("pipeline:counter");
+      const otherKey = getTestKey("pipeline:value");
+      testKeys.push(key, otherKey);
+
+      await client.set(key, "1");
+      const pipeline = client
+        .pipeline(2)
+        .set(otherKey, "Pipelined")
+        .atomicIncrement(key, 2);
+      expect(pipeline.length).toBe(2);
+
+      const [, incrementResult] = await pipeline.exec();
+      expect(incrementResult.result).toBe(3);
+      expect(pipeline.length).toBe(0);
+
+      const result = await client.get(otherKey);
+      expect(result.value).toBe("Pipelined");
+    });
+  });
+
   describe("Partial Updates", () => {
     const testKeys: string[] = [];
 
@@ -150,10 +199,10 @@ describe("HPKVClient Integration Tests", () => {
         { key: getTestKey("range:4"), value: "Fourth" },
       ];
 
-      for (const { key, value } of testData) {
-        testKeys.push(key);
-        await client.set(key, value);
-      }
+      testKeys.push(...testData.map(({ key }) => key));
+      await client.multiSet(
+        Object.fromEntries(testData.map(({ key, value }) => [key, value])),
+      );
 
       // Query the range
       const results = await client.range(
@@ -213,10 +262,10 @@ describe("HPKVClient Integration Tests", () => {
         getTestKey("special-range:!@#$%^&*()_+:3"),
       ];
 
-      for (const key of specialKeys) {
-        testKeys.push(key);
-        await client.set(key, `Value for ${key}`);
-      }
+      testKeys.push(...specialKeys);
+      await client.multiSet(
+        Object.fromEntries(specialKeys.map((key) => [key, `Value for ${key}`])),
+      );
 
       const results = await client.range(specialKeys[0], specialKeys[2], 10);
 
@@ -341,10 +390,10 @@ describe("HPKVClient Integration Tests", () => {
         { key: getTestKey("range:111"), value: "Fifth" },
       ];
 
-      for (const { key, value } of testData) {
-        testKeys.push(key);
-        await client.set(key, value);
-      }
+      testKeys.push(...testData.map(({ key }) => key));
+      await client.multiSet(
+        Object.fromEntries(testData.map(({ key, value }) => [key, value])),
+      );
     });
 
     afterAll(async () => {
@@ -384,6 +433,25 @@ describe("HPKVClient Integration Tests", () => {
       expect(results.truncated).toBe(false);
     });
 
+    test("should scan a range across several pages", async () => {
+      const keys: string[] = [];
+      for await (const record of client.scan(
+        getTestKey("range:001"),
+        getTestKey("range:111"),
+        2,
+      )) {
+        keys.push(record.key);
+      }
+
+      expect(keys).toEqual([
+        getTestKey("range:001"),
+        getTestKey("range:010"),
+        getTestKey("range:100"),
+        getTestKey("range:101"),
+        getTestKey("range:111"),
+      ]);
+    });
+
     test("should properly order results lexicographically", async () => {
       const results = await client.range(
         getTestKey("range:001"),
@@ -396,6 +464,37 @@ describe("HPKVClient Integration Tests", () => {
     });
   });
 
+  describe("Client Options", () => {
+    const testKeys: string[] = [];
+
+    afterAll(async () => {
+      await cleanup(testKeys);
+    });
+
+    test("should send every request through a custom fetch", async () => {
+      const key = getTestKey("custom-fetch");
+      testKeys.push(key);
+      let calls = 0;
+      const pooledClient = new HPKVRestClient(
+        process.env.HPKV_API_BASE_URL || "",
+        process.env.HPKV_NEXUS_URL || "",
+        process.env.HPKV_API_KEY || "",
+        {
+          fetch: (input, init) => {
+            calls++;
+            return fetch(input, init);
+          },
+          maxRetries: 0,
+        },
+      );
+
+      await pooledClient.set(key, "Through custom fetch");
+      const result = await pooledClient.get(key);
+      expect(result.value).toBe("Through custom fetch");
+      expect(calls).toBe(2);
+    });
+  });
+
   describe("Error Handling", () => {
     test("should handle non-existent keys", async () => {
       const key = getTestKey("nonexistent");